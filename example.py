@@ -2,7 +2,6 @@
 
 import asyncio
 import logging
-from dataclasses import astuple
 
 from aiohttp import ClientConnectorError, ClientSession
 from tenacity import RetryError
@@ -19,7 +18,7 @@ async def main() -> None:
     async with ClientSession() as websession:
         try:
             nextdns = await NextDns.create(websession, API_KEY)
-            profile_id, profile_fingerprint, profile_name = astuple(nextdns.profiles[0])
+            profile_id, profile_fingerprint, profile_name = nextdns.profiles[0]
             status = await nextdns.get_analytics_status(profile_id)
             dnssec = await nextdns.get_analytics_dnssec(profile_id)
             encryption = await nextdns.get_analytics_encryption(profile_id)
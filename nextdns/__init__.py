@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Iterable
+from collections.abc import Coroutine
+from functools import partial
 from http import HTTPStatus
 from typing import Any, cast
 
-from aiohttp import ClientConnectorError, ClientSession
+import orjson
+from aiohttp import ClientConnectorError, ClientError, ClientSession
+from multidict import CIMultiDict
 from tenacity import (
     after_log,
     retry,
@@ -20,7 +23,9 @@ from tenacity import (
 from .const import (
     ALLOWED_LOGS_LOCATION,
     ALLOWED_LOGS_RETENTION,
-    ATTR_ANALYTICS,
+    ANALYTICS_ENDPOINTS,
+    API_ENDPOINT,
+    ATTR_ANALYTICS,  # noqa: F401
     ATTR_CLEAR_LOGS,
     ATTR_ENABLED,
     ATTR_GET_LOGS,
@@ -45,6 +50,7 @@ from .const import (
     MAP_PROTOCOLS,
     MAP_SETTING,
     MAP_STATUS,
+    MUTATING_METHODS,
     PARENTAL_CONTROL_CATEGORIES,
     PARENTAL_CONTROL_SERVICES,
     STOP_AFTER_ATTEMPT,
@@ -68,6 +74,7 @@ from .model import (
     AnalyticsStatus,
     ApiNames,
     ConnectionStatus,
+    FullSnapshot,
     ParentalControlCategories,
     ParentalControlServices,
     Profile,
@@ -81,25 +88,67 @@ _LOGGER = logging.getLogger(__name__)
 class NextDns:
     """Main class of NextDNS API wrapper."""
 
-    def __init__(self, session: ClientSession, api_key: str) -> None:
+    def __init__(
+        self, session: ClientSession, api_key: str, *, ttl_seconds: float = 0
+    ) -> None:
         """Initialize NextDNS API wrapper."""
         self._session = session
-        self._headers = {"X-Api-Key": api_key, "Content-Type": "application/json"}
+        self._headers = CIMultiDict({"X-Api-Key": api_key})
+        self._json_headers = CIMultiDict(
+            {"X-Api-Key": api_key, "Content-Type": "application/json"}
+        )
         self._api_key = api_key
         self._profiles: list[ProfileInfo]
+        self._id_to_name: dict[str, str] = {}
+        self._name_to_id: dict[str, str] = {}
+        self._fingerprint_to_id: dict[str, str] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Task[Any]] = {}
+        self._ttl_seconds = ttl_seconds
+        self._cache: dict[tuple[str, str], tuple[float, Any]] = {}
 
     @classmethod
-    async def create(cls, session: ClientSession, api_key: str) -> NextDns:
+    async def create(
+        cls,
+        session: ClientSession,
+        api_key: str,
+        *,
+        eager_warmup: bool = False,
+        ttl_seconds: float = 0,
+    ) -> NextDns:
         """Create a new instance."""
-        instance = cls(session, api_key)
-        await instance.initialize()
+        instance = cls(session, api_key, ttl_seconds=ttl_seconds)
+        await instance.initialize(eager_warmup=eager_warmup)
 
         return instance
 
-    async def initialize(self) -> None:
+    async def initialize(self, *, eager_warmup: bool = False) -> None:
         """Initialize."""
         _LOGGER.debug("Initializing with API Key: %s...", self._api_key[:10])
-        self._profiles = list(self._parse_profiles(await self.get_profiles()))
+        if eager_warmup:
+            profiles, _ = await asyncio.gather(self.get_profiles(), self._warmup())
+        else:
+            profiles = await self.get_profiles()
+
+        self._profiles = [
+            ProfileInfo(profile["id"], profile["fingerprint"], profile["name"])
+            for profile in profiles
+        ]
+        self._id_to_name = {profile.id: profile.name for profile in self._profiles}
+        # iterate in reverse so that the first profile wins for duplicate names
+        self._name_to_id = {
+            profile.name: profile.id for profile in reversed(self._profiles)
+        }
+        self._fingerprint_to_id = {
+            profile.fingerprint: profile.id for profile in self._profiles
+        }
+
+    async def _warmup(self) -> None:
+        """Pre-open an additional pooled connection for the first fan-out."""
+        try:
+            async with self._session.head(API_ENDPOINT, timeout=TIMEOUT):
+                pass
+        except (ClientError, TimeoutError) as error:
+            _LOGGER.debug("Connection warmup failed: %s", error)
 
     @retry(
         retry=retry_if_exception_type((TimeoutError, ClientConnectorError)),
@@ -246,11 +295,11 @@ class NextDns:
     )
     async def get_analytics_status(self, profile_id: str) -> AnalyticsStatus:
         """Get profile analytics status."""
-        url = ENDPOINTS[ATTR_ANALYTICS].format(profile_id=profile_id, type="status")
-        resp = await self._http_request("get", url)
+        resp = await self._get_analytics(profile_id, "status")
+        get_attr = MAP_STATUS.__getitem__
 
         return AnalyticsStatus(
-            **{MAP_STATUS[item["status"]]: item["queries"] for item in resp}
+            **{get_attr(item["status"]): item["queries"] for item in resp}
         )
 
     @retry(
@@ -261,11 +310,11 @@ class NextDns:
     )
     async def get_analytics_dnssec(self, profile_id: str) -> AnalyticsDnssec:
         """Get profile analytics dnssec."""
-        url = ENDPOINTS[ATTR_ANALYTICS].format(profile_id=profile_id, type="dnssec")
-        resp = await self._http_request("get", url)
+        resp = await self._get_analytics(profile_id, "dnssec")
+        get_attr = MAP_DNSSEC.__getitem__
 
         return AnalyticsDnssec(
-            **{MAP_DNSSEC[item["validated"]]: item["queries"] for item in resp}
+            **{get_attr(item["validated"]): item["queries"] for item in resp}
         )
 
     @retry(
@@ -276,11 +325,11 @@ class NextDns:
     )
     async def get_analytics_encryption(self, profile_id: str) -> AnalyticsEncryption:
         """Get profile analytics encryption."""
-        url = ENDPOINTS[ATTR_ANALYTICS].format(profile_id=profile_id, type="encryption")
-        resp = await self._http_request("get", url)
+        resp = await self._get_analytics(profile_id, "encryption")
+        get_attr = MAP_ENCRYPTED.__getitem__
 
         return AnalyticsEncryption(
-            **{MAP_ENCRYPTED[item["encrypted"]]: item["queries"] for item in resp}
+            **{get_attr(item["encrypted"]): item["queries"] for item in resp}
         )
 
     @retry(
@@ -291,11 +340,11 @@ class NextDns:
     )
     async def get_analytics_ip_versions(self, profile_id: str) -> AnalyticsIpVersions:
         """Get profile analytics IP versions."""
-        url = ENDPOINTS[ATTR_ANALYTICS].format(profile_id=profile_id, type="ipVersions")
-        resp = await self._http_request("get", url)
+        resp = await self._get_analytics(profile_id, "ipVersions")
+        get_attr = MAP_IP_VERSIONS.__getitem__
 
         return AnalyticsIpVersions(
-            **{MAP_IP_VERSIONS[item["version"]]: item["queries"] for item in resp}
+            **{get_attr(item["version"]): item["queries"] for item in resp}
         )
 
     @retry(
@@ -306,13 +355,32 @@ class NextDns:
     )
     async def get_analytics_protocols(self, profile_id: str) -> AnalyticsProtocols:
         """Get profile analytics protocols."""
-        url = ENDPOINTS[ATTR_ANALYTICS].format(profile_id=profile_id, type="protocols")
-        resp = await self._http_request("get", url)
+        resp = await self._get_analytics(profile_id, "protocols")
+        get_attr = MAP_PROTOCOLS.__getitem__
 
         return AnalyticsProtocols(
-            **{MAP_PROTOCOLS[item["protocol"]]: item["queries"] for item in resp}
+            **{get_attr(item["protocol"]): item["queries"] for item in resp}
         )
 
+    async def _get_analytics(self, profile_id: str, analytics_type: str) -> Any:
+        """Get analytics data, cached for ttl_seconds if enabled."""
+        key = (profile_id, analytics_type)
+        loop = asyncio.get_running_loop()
+
+        if self._ttl_seconds and (cached := self._cache.get(key)):
+            timestamp, resp = cached
+            if loop.time() - timestamp < self._ttl_seconds:
+                return resp
+            del self._cache[key]
+
+        url = ANALYTICS_ENDPOINTS[analytics_type].format(profile_id=profile_id)
+        resp = await self._http_request("get", url)
+
+        if self._ttl_seconds:
+            self._cache[key] = (loop.time(), resp)
+
+        return resp
+
     @retry(
         retry=retry_if_exception_type((TimeoutError, ClientConnectorError)),
         stop=stop_after_attempt(STOP_AFTER_ATTEMPT),
@@ -326,18 +394,14 @@ class NextDns:
 
         used_profile_id = None
         if status := resp["status"] == "ok":
-            for item in self.profiles:
-                if item.fingerprint == resp.get("profile"):
-                    used_profile_id = item.id
+            used_profile_id = self._fingerprint_to_id.get(resp.get("profile"))
 
         return ConnectionStatus(status, used_profile_id)
 
     async def clear_logs(self, profile_id: str) -> bool:
         """Clear NextDNS logs."""
         url = ENDPOINTS[ATTR_CLEAR_LOGS].format(profile_id=profile_id)
-        result = await self._http_request("delete", url)
-
-        return result.get("success", False) is True
+        return await self._http_request("delete", url) is True
 
     @retry(
         retry=retry_if_exception_type((TimeoutError, ClientConnectorError)),
@@ -354,15 +418,37 @@ class NextDns:
 
     async def get_all_analytics(self, profile_id: str) -> AllAnalytics:
         """Get profile analytics."""
-        resp = await asyncio.gather(
-            self.get_analytics_dnssec(profile_id),
-            self.get_analytics_encryption(profile_id),
-            self.get_analytics_ip_versions(profile_id),
-            self.get_analytics_protocols(profile_id),
-            self.get_analytics_status(profile_id),
+        try:
+            async with asyncio.TaskGroup() as tg:
+                dnssec = tg.create_task(self.get_analytics_dnssec(profile_id))
+                encryption = tg.create_task(self.get_analytics_encryption(profile_id))
+                ip_versions = tg.create_task(self.get_analytics_ip_versions(profile_id))
+                protocols = tg.create_task(self.get_analytics_protocols(profile_id))
+                status = tg.create_task(self.get_analytics_status(profile_id))
+        except ExceptionGroup as error:
+            raise self._first_exception(error) from None
+
+        return AllAnalytics(
+            dnssec.result(),
+            encryption.result(),
+            ip_versions.result(),
+            protocols.result(),
+            status.result(),
         )
 
-        return AllAnalytics(*resp)
+    async def get_everything(self, profile_id: str) -> FullSnapshot:
+        """Get profile analytics, connection status and profile at once."""
+        try:
+            async with asyncio.TaskGroup() as tg:
+                analytics = tg.create_task(self.get_all_analytics(profile_id))
+                connection_status = tg.create_task(self.connection_status(profile_id))
+                profile = tg.create_task(self.get_profile(profile_id))
+        except ExceptionGroup as error:
+            raise self._first_exception(error) from None
+
+        return FullSnapshot(
+            analytics.result(), connection_status.result(), profile.result()
+        )
 
     async def set_logs_location(self, profile_id: str, location: str) -> bool:
         """Set logs location."""
@@ -374,9 +460,7 @@ class NextDns:
 
         url = MAP_SETTING[ATTR_LOGS_LOCATION].url.format(profile_id=profile_id)
         name = MAP_SETTING[ATTR_LOGS_LOCATION].name
-        result = await self._http_request("patch", url, data={name: location})
-
-        return result.get("success", False) is True
+        return await self._http_request("patch", url, data={name: location}) is True
 
     async def set_logs_retention(self, profile_id: str, hours: int) -> bool:
         """Set logs retention."""
@@ -388,14 +472,14 @@ class NextDns:
 
         url = MAP_SETTING[ATTR_LOGS_RETENTION].url.format(profile_id=profile_id)
         name = MAP_SETTING[ATTR_LOGS_RETENTION].name
-        result = await self._http_request("patch", url, data={name: hours * 60 * 60})
-
-        return result.get("success", False) is True
+        return (
+            await self._http_request("patch", url, data={name: hours * 60 * 60}) is True
+        )
 
     async def set_setting(self, profile_id: str, setting: str, state: bool) -> bool:
         """Toggle settings."""
         data: dict[str, Any]
-        resp = {}
+        resp = None
 
         if setting not in MAP_SETTING:
             raise SettingNotSupportedError
@@ -433,10 +517,71 @@ class NextDns:
             data = {str(MAP_SETTING[setting].name): state}
             resp = await self._http_request("patch", url, data=data)
 
-        return resp.get("success", False) is True
+        return resp is True
+
+    async def set_settings(self, profile_id: str, **settings: bool) -> bool:
+        """Toggle several settings, merging those sharing an endpoint."""
+        if not settings:
+            raise ValueError("No settings to change")
+        if any(setting not in MAP_SETTING for setting in settings):
+            raise SettingNotSupportedError
+
+        payloads: dict[str, dict[str, Any]] = {}
+        requests: list[Coroutine[Any, Any, bool]] = []
+
+        for setting, state in settings.items():
+            if (
+                setting in PARENTAL_CONTROL_CATEGORIES
+                or setting in PARENTAL_CONTROL_SERVICES
+            ):
+                requests.append(self.set_setting(profile_id, setting, state))
+                continue
+
+            url = MAP_SETTING[setting].url.format(profile_id=profile_id)
+            payloads.setdefault(url, {})[str(MAP_SETTING[setting].name)] = state
+
+        requests.extend(self._patch(url, data) for url, data in payloads.items())
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(request) for request in requests]
+        except ExceptionGroup as error:
+            raise self._first_exception(error) from None
+
+        return all(task.result() for task in tasks)
+
+    async def _patch(self, url: str, data: dict[str, Any]) -> bool:
+        """Make a PATCH request and return True on success."""
+        return await self._http_request("patch", url, data=data) is True
 
     async def _http_request(
         self, method: str, url: str, data: dict[str, Any] | None = None
+    ) -> Any:
+        """Make an HTTP request, sharing the result of identical in-flight GETs."""
+        if method != "get":
+            return await self._send_request(method, url, data)
+
+        key = (method, url)
+        if (task := self._inflight.get(key)) is None:
+            task = asyncio.create_task(self._send_request(method, url, data))
+            task.add_done_callback(partial(self._inflight_done, key))
+            self._inflight[key] = task
+        else:
+            _LOGGER.debug("Joining in-flight request for %s", url)
+
+        # cancelling one caller must not cancel the request shared with others
+        return await asyncio.shield(task)
+
+    def _inflight_done(self, key: tuple[str, str], task: asyncio.Task[Any]) -> None:
+        """Forget a finished in-flight request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # mark the exception as retrieved when every caller has been cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _send_request(
+        self, method: str, url: str, data: dict[str, Any] | None = None
     ) -> Any:
         """Make an HTTP request."""
         _LOGGER.debug("Requesting %s, method: %s, data: %s", url, method, data)
@@ -445,8 +590,8 @@ class NextDns:
             resp = await self._session.request(
                 method,
                 url,
-                headers=self._headers,
-                json=data,
+                headers=self._json_headers,
+                data=orjson.dumps(data),
                 timeout=TIMEOUT,
             )
         else:
@@ -454,32 +599,29 @@ class NextDns:
 
         _LOGGER.debug("Response status %s for %s", resp.status, url)
 
-        if resp.status == HTTPStatus.FORBIDDEN.value:
-            raise InvalidApiKeyError
-        if resp.status == HTTPStatus.NO_CONTENT.value and method in (
-            "delete",
-            "patch",
-            "post",
-        ):
-            return {"success": True}
-        if resp.status == HTTPStatus.TOO_MANY_REQUESTS.value:
-            raise ApiError("Too many requests")
         if resp.status == HTTP_STATUS_TIMEOUT:
             raise TimeoutError("Timeout occurred: HTTP 524")
-        if resp.status != HTTPStatus.OK.value:
-            if resp.content_type == "application/json":
-                result = await resp.json()
-                error = result["errors"][0]
-                raise ApiError(
-                    f"{resp.status}, {error['code']}, "
-                    f"{error.get('detail', 'no detail')}"
-                )
+
+        match resp.status:
+            case HTTPStatus.FORBIDDEN:
+                raise InvalidApiKeyError
+            case HTTPStatus.NO_CONTENT if method in MUTATING_METHODS:
+                return True
+            case HTTPStatus.TOO_MANY_REQUESTS:
+                raise ApiError("Too many requests")
+
+        body = await resp.read()
+        is_json = resp.content_type == "application/json"
+
+        if resp.status != HTTPStatus.OK:
+            if is_json:
+                raise self._parse_error(resp.status, body)
             raise ApiError(f"Error code: {resp.status}")
 
-        if resp.content_type == "application/json":
-            result = await resp.json()
+        if is_json:
+            result = orjson.loads(body) if body.strip() else None
         else:
-            result = await resp.text()
+            result = body.decode(resp.get_encoding())
 
         if isinstance(result, dict) and "data" in result:
             return result["data"]
@@ -488,25 +630,38 @@ class NextDns:
 
     def get_profile_name(self, profile_id: str) -> str:
         """Get profile name."""
-        for profile in self.profiles:
-            if profile.id == profile_id:
-                return profile.name
-
-        raise ProfileIdNotFoundError
+        try:
+            return self._id_to_name[profile_id]
+        except KeyError as exc:
+            raise ProfileIdNotFoundError from exc
 
     def get_profile_id(self, profile_name: str) -> str:
         """Get profile ID."""
-        for profile in self.profiles:
-            if profile.name == profile_name:
-                return profile.id
+        try:
+            return self._name_to_id[profile_name]
+        except KeyError as exc:
+            raise ProfileNameNotFoundError from exc
+
+    @staticmethod
+    def _parse_error(status: int, body: bytes) -> ApiError:
+        """Parse error response."""
+        try:
+            error = orjson.loads(body)["errors"][0]
+            message = f"{status}, {error['code']}, {error.get('detail', 'no detail')}"
+        except (orjson.JSONDecodeError, LookupError, TypeError):
+            return ApiError(f"Error code: {status}")
 
-        raise ProfileNameNotFoundError
+        return ApiError(message)
 
     @staticmethod
-    def _parse_profiles(profiles: list[dict[str, str]]) -> Iterable[ProfileInfo]:
-        """Parse profiles."""
-        for profile in profiles:
-            yield ProfileInfo(profile["id"], profile["fingerprint"], profile["name"])
+    def _first_exception(error: ExceptionGroup[Exception]) -> Exception:
+        """Return the first exception of a task group, logging the others."""
+        first, *others = error.exceptions
+        for exc in others:
+            _LOGGER.debug("Discarding concurrent exception: %r", exc)
+
+        # keep raising the original exception types to callers
+        return first
 
     @property
     def profiles(self) -> list[ProfileInfo]:
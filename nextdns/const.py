@@ -87,6 +87,11 @@ ENDPOINTS = {
     ATTR_BLOCK_PAGE: "https://api.nextdns.io/profiles/{profile_id}/settings/blockPage",
 }
 
+ANALYTICS_ENDPOINTS = {
+    analytics_type: ENDPOINTS[ATTR_ANALYTICS].replace("{type}", analytics_type)
+    for analytics_type in ("dnssec", "encryption", "ipVersions", "protocols", "status")
+}
+
 MAP_DNSSEC = {False: "not_validated_queries", True: "validated_queries"}
 MAP_ENCRYPTED = {False: "unencrypted_queries", True: "encrypted_queries"}
 MAP_IP_VERSIONS = {4: "ipv4_queries", 6: "ipv6_queries"}
@@ -329,3 +334,5 @@ WAIT_INCREMENT = 2
 WAIT_START = 2
 
 HTTP_STATUS_TIMEOUT = 524
+
+MUTATING_METHODS = frozenset(("delete", "patch", "post"))
@@ -4,15 +4,24 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import Any
+from typing import Any, NamedTuple
 
 
-@dataclass
+def _ratio(value: int, total: int) -> float:
+    """Return value as a percentage of total rounded to one decimal place."""
+    if not total:
+        return 0
+
+    # integer round half up of value * 1000 / total, then scale to percent
+    return (value * 2000 + total) // (2 * total) / 10
+
+
+@dataclass(slots=True)
 class NextDnsData:
     """NextDNS data class."""
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyticsStatus(NextDnsData):
     """AnalyticsStatus class."""
 
@@ -25,23 +34,18 @@ class AnalyticsStatus(NextDnsData):
 
     def __post_init__(self) -> None:
         """Call after initialization."""
-        self.all_queries = sum(
-            [
-                self.default_queries,
-                self.blocked_queries,
-                self.allowed_queries,
-                self.relayed_queries,
-            ]
+        all_queries = (
+            self.default_queries
+            + self.blocked_queries
+            + self.allowed_queries
+            + self.relayed_queries
         )
+        self.all_queries = all_queries
 
-        self.blocked_queries_ratio = (
-            0
-            if not self.all_queries
-            else round(self.blocked_queries / self.all_queries * 100, 1)
-        )
+        self.blocked_queries_ratio = _ratio(self.blocked_queries, all_queries)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyticsDnssec(NextDnsData):
     """AnalyticsDnssec class."""
 
@@ -51,16 +55,12 @@ class AnalyticsDnssec(NextDnsData):
 
     def __post_init__(self) -> None:
         """Call after initialization."""
-        all_queries = sum([self.validated_queries, self.not_validated_queries])
+        all_queries = self.validated_queries + self.not_validated_queries
 
-        self.validated_queries_ratio = (
-            0
-            if not all_queries
-            else round(self.validated_queries / all_queries * 100, 1)
-        )
+        self.validated_queries_ratio = _ratio(self.validated_queries, all_queries)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyticsEncryption(NextDnsData):
     """AnalyticsEncryption class."""
 
@@ -70,16 +70,12 @@ class AnalyticsEncryption(NextDnsData):
 
     def __post_init__(self) -> None:
         """Call after initialization."""
-        all_queries = sum([self.encrypted_queries, self.unencrypted_queries])
+        all_queries = self.encrypted_queries + self.unencrypted_queries
 
-        self.encrypted_queries_ratio = (
-            0
-            if not all_queries
-            else round(self.encrypted_queries / all_queries * 100, 1)
-        )
+        self.encrypted_queries_ratio = _ratio(self.encrypted_queries, all_queries)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyticsIpVersions(NextDnsData):
     """AnalyticsIpVersions class."""
 
@@ -89,14 +85,12 @@ class AnalyticsIpVersions(NextDnsData):
 
     def __post_init__(self) -> None:
         """Call after initialization."""
-        all_queries = sum([self.ipv6_queries, self.ipv4_queries])
+        all_queries = self.ipv6_queries + self.ipv4_queries
 
-        self.ipv6_queries_ratio = (
-            0 if not all_queries else round(self.ipv6_queries / all_queries * 100, 1)
-        )
+        self.ipv6_queries_ratio = _ratio(self.ipv6_queries, all_queries)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyticsProtocols(NextDnsData):
     """AnalyticsProtocols class."""
 
@@ -115,38 +109,24 @@ class AnalyticsProtocols(NextDnsData):
 
     def __post_init__(self) -> None:
         """Call after initialization."""
-        all_queries = sum(
-            [
-                self.doh_queries,
-                self.doh3_queries,
-                self.doq_queries,
-                self.dot_queries,
-                self.tcp_queries,
-                self.udp_queries,
-            ]
+        all_queries = (
+            self.doh_queries
+            + self.doh3_queries
+            + self.doq_queries
+            + self.dot_queries
+            + self.tcp_queries
+            + self.udp_queries
         )
 
-        self.doh_queries_ratio = (
-            0 if not all_queries else round(self.doh_queries / all_queries * 100, 1)
-        )
-        self.doh3_queries_ratio = (
-            0 if not all_queries else round(self.doh3_queries / all_queries * 100, 1)
-        )
-        self.doq_queries_ratio = (
-            0 if not all_queries else round(self.doq_queries / all_queries * 100, 1)
-        )
-        self.dot_queries_ratio = (
-            0 if not all_queries else round(self.dot_queries / all_queries * 100, 1)
-        )
-        self.tcp_queries_ratio = (
-            0 if not all_queries else round(self.tcp_queries / all_queries * 100, 1)
-        )
-        self.udp_queries_ratio = (
-            0 if not all_queries else round(self.udp_queries / all_queries * 100, 1)
-        )
+        self.doh_queries_ratio = _ratio(self.doh_queries, all_queries)
+        self.doh3_queries_ratio = _ratio(self.doh3_queries, all_queries)
+        self.doq_queries_ratio = _ratio(self.doq_queries, all_queries)
+        self.dot_queries_ratio = _ratio(self.dot_queries, all_queries)
+        self.tcp_queries_ratio = _ratio(self.tcp_queries, all_queries)
+        self.udp_queries_ratio = _ratio(self.udp_queries, all_queries)
 
 
-@dataclass
+@dataclass(slots=True)
 class AllAnalytics(NextDnsData):
     """AllAnalytics class."""
 
@@ -157,7 +137,7 @@ class AllAnalytics(NextDnsData):
     status: AnalyticsStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile(NextDnsData):
     """Profile class."""
 
@@ -174,7 +154,7 @@ class Profile(NextDnsData):
     setup: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings(NextDnsData):
     """Settings class."""
 
@@ -260,8 +240,7 @@ class Settings(NextDnsData):
     block_video_streaming: bool
 
 
-@dataclass
-class ProfileInfo(NextDnsData):
+class ProfileInfo(NamedTuple):
     """ProfileInfo class."""
 
     id: str
@@ -269,7 +248,7 @@ class ProfileInfo(NextDnsData):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionStatus(NextDnsData):
     """ConnectionStatus class."""
 
@@ -424,7 +403,16 @@ class ApiNames(StrEnum):
     YOUTUBE_RESTRICTED_MODE = "youtubeRestrictedMode"
 
 
-@dataclass
+@dataclass(slots=True)
+class FullSnapshot(NextDnsData):
+    """FullSnapshot class."""
+
+    analytics: AllAnalytics
+    connection_status: ConnectionStatus
+    profile: Profile
+
+
+@dataclass(slots=True)
 class SettingDescription:
     """SettingDescription class."""
 
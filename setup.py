@@ -21,7 +21,7 @@ setup(
     packages=["nextdns"],
     package_data={"nextdns": ["py.typed"]},
     python_requires=">=3.11",
-    install_requires=["aiohttp>=3.7.0"],
+    install_requires=["aiohttp>=3.7.0", "orjson>=3.8.0"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "License :: OSI Approved :: Apache Software License",
@@ -1,5 +1,6 @@
 """Tests for nextdns package."""
 
+import asyncio
 import json
 import re
 from http import HTTPStatus
@@ -8,10 +9,12 @@ from typing import Any
 from unittest.mock import Mock, patch
 
 import aiohttp
+import orjson
 import pytest
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from syrupy import SnapshotAssertion
 from tenacity import RetryError
+from yarl import URL
 
 from nextdns import (
     ATTR_ANALYTICS,
@@ -32,7 +35,7 @@ from nextdns import (
     ProfileNameNotFoundError,
     SettingNotSupportedError,
 )
-from nextdns.const import ATTR_BLOCK_PAGE
+from nextdns.const import API_ENDPOINT, ATTR_BLOCK_PAGE
 
 PROFILE_ID = "fakepr"
 
@@ -105,6 +108,61 @@ async def test_valid_data(
     assert nextdns.get_profile_id("Fake Profile") == snapshot
 
 
+@pytest.mark.asyncio
+async def test_get_everything(profiles_data: dict[str, Any]) -> None:
+    """Test get_everything() method."""
+    fixtures = {}
+    for name in (
+        "dnssec",
+        "encryption",
+        "ip_versions",
+        "protocols",
+        "status",
+        "test",
+        "profile",
+    ):
+        with Path.open(f"tests/fixtures/{name}.json", encoding="utf-8") as file:
+            fixtures[name] = json.load(file)
+
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        for analytics_type, name in (
+            ("dnssec", "dnssec"),
+            ("encryption", "encryption"),
+            ("ipVersions", "ip_versions"),
+            ("protocols", "protocols"),
+            ("status", "status"),
+        ):
+            session_mock.get(
+                ENDPOINTS[ATTR_ANALYTICS].format(
+                    profile_id=PROFILE_ID, type=analytics_type
+                ),
+                payload=fixtures[name],
+            )
+        session_mock.get(
+            ENDPOINTS[ATTR_TEST].format(profile_id=PROFILE_ID),
+            payload=fixtures["test"],
+        )
+        session_mock.get(
+            ENDPOINTS[ATTR_PROFILE].format(profile_id=PROFILE_ID),
+            payload=fixtures["profile"],
+        )
+
+        nextdns = await NextDns.create(session, "fakeapikey")
+
+        result = await nextdns.get_everything(PROFILE_ID)
+
+    await session.close()
+
+    assert result.analytics.status.all_queries == 1380300
+    assert result.analytics.protocols.doh_queries == 99999
+    assert result.connection_status.connected is True
+    assert result.connection_status.profile_id == PROFILE_ID
+    assert result.profile.id == PROFILE_ID
+
+
 @pytest.mark.asyncio
 async def test_profile_id_not_found(profiles_data: dict[str, Any]) -> None:
     """Test with wrong profile id."""
@@ -504,3 +562,433 @@ async def test_set_logs_location_with_invalid_value(
         ),
     ):
         await nextdns.set_logs_location(PROFILE_ID, "pl")
+
+
+@pytest.mark.asyncio
+async def test_eager_warmup(profiles_data: dict[str, Any]) -> None:
+    """Test connection warmup during initialization."""
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        session_mock.head(API_ENDPOINT, status=HTTPStatus.NOT_FOUND.value)
+
+        nextdns = await NextDns.create(session, "fakeapikey", eager_warmup=True)
+
+    await session.close()
+
+    assert nextdns.get_profile_name(PROFILE_ID) == "Fake Profile"
+
+
+@pytest.mark.asyncio
+async def test_eager_warmup_failed(profiles_data: dict[str, Any]) -> None:
+    """Test that failed connection warmup does not break initialization."""
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        session_mock.head(API_ENDPOINT, exception=TimeoutError)
+
+        nextdns = await NextDns.create(session, "fakeapikey", eager_warmup=True)
+
+    await session.close()
+
+    assert nextdns.get_profile_name(PROFILE_ID) == "Fake Profile"
+
+
+@pytest.mark.asyncio
+async def test_coalesce_inflight_requests(profiles_data: dict[str, Any]) -> None:
+    """Test that identical concurrent GET requests share one HTTP call."""
+    with Path.open("tests/fixtures/status.json", encoding="utf-8") as file:
+        status_data = json.load(file)
+
+    async def delayed_response(*_args: Any, **_kwargs: Any) -> CallbackResult:
+        await asyncio.sleep(0)
+        return CallbackResult(payload=status_data)
+
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        session_mock.get(
+            ENDPOINTS[ATTR_ANALYTICS].format(profile_id=PROFILE_ID, type="status"),
+            callback=delayed_response,
+        )
+
+        nextdns = await NextDns.create(session, "fakeapikey")
+
+        first, second = await asyncio.gather(
+            nextdns.get_analytics_status(PROFILE_ID),
+            nextdns.get_analytics_status(PROFILE_ID),
+        )
+
+    await session.close()
+
+    assert first == second
+    assert first.all_queries == 1380300
+
+
+@pytest.mark.asyncio
+async def test_coalesce_inflight_requests_leader_cancelled(
+    profiles_data: dict[str, Any],
+) -> None:
+    """Test that cancelling the first caller does not cancel joined callers."""
+    with Path.open("tests/fixtures/status.json", encoding="utf-8") as file:
+        status_data = json.load(file)
+
+    release = asyncio.Event()
+
+    async def delayed_response(*_args: Any, **_kwargs: Any) -> CallbackResult:
+        await release.wait()
+        return CallbackResult(payload=status_data)
+
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        session_mock.get(
+            ENDPOINTS[ATTR_ANALYTICS].format(profile_id=PROFILE_ID, type="status"),
+            callback=delayed_response,
+        )
+
+        nextdns = await NextDns.create(session, "fakeapikey")
+
+        leader = asyncio.create_task(nextdns.get_analytics_status(PROFILE_ID))
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(nextdns.get_analytics_status(PROFILE_ID))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        release.set()
+        result = await joiner
+
+    await session.close()
+
+    assert result.all_queries == 1380300
+
+
+@pytest.mark.asyncio
+async def test_coalesce_inflight_requests_error(profiles_data: dict[str, Any]) -> None:
+    """Test that an error is propagated to all coalesced callers."""
+
+    async def delayed_response(*_args: Any, **_kwargs: Any) -> CallbackResult:
+        await asyncio.sleep(0)
+        return CallbackResult(status=429)
+
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        session_mock.get(
+            ENDPOINTS[ATTR_ANALYTICS].format(profile_id=PROFILE_ID, type="status"),
+            callback=delayed_response,
+        )
+
+        nextdns = await NextDns.create(session, "fakeapikey")
+
+        results = await asyncio.gather(
+            nextdns.get_analytics_status(PROFILE_ID),
+            nextdns.get_analytics_status(PROFILE_ID),
+            return_exceptions=True,
+        )
+
+    await session.close()
+
+    assert all(isinstance(result, ApiError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_error_with_unexpected_json() -> None:
+    """Test error status code with JSON response without errors list."""
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(
+            ENDPOINTS[ATTR_PROFILES],
+            status=HTTPStatus.INTERNAL_SERVER_ERROR.value,
+            payload={"message": "Internal error"},
+        )
+
+        with pytest.raises(ApiError, match=re.escape("Error code: 500")):
+            await NextDns.create(session, "fakeapikey")
+
+    await session.close()
+
+
+@pytest.mark.parametrize(
+    ("ttl_seconds", "elapsed", "expected_calls"),
+    [(60, 30, 1), (60, 61, 2), (0, 0, 2)],
+)
+@pytest.mark.asyncio
+async def test_analytics_cache(
+    profiles_data: dict[str, Any],
+    ttl_seconds: int,
+    elapsed: int,
+    expected_calls: int,
+) -> None:
+    """Test caching of analytics responses with ttl_seconds."""
+    with Path.open("tests/fixtures/status.json", encoding="utf-8") as file:
+        status_data = json.load(file)
+
+    url = ENDPOINTS[ATTR_ANALYTICS].format(profile_id=PROFILE_ID, type="status")
+    loop = asyncio.get_running_loop()
+    now = loop.time()
+
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        session_mock.get(url, payload=status_data, repeat=True)
+
+        nextdns = await NextDns.create(session, "fakeapikey", ttl_seconds=ttl_seconds)
+
+        with patch.object(loop, "time", return_value=now):
+            first = await nextdns.get_analytics_status(PROFILE_ID)
+        with patch.object(loop, "time", return_value=now + elapsed):
+            second = await nextdns.get_analytics_status(PROFILE_ID)
+
+        calls = session_mock.requests[("get", URL(url))]
+
+    await session.close()
+
+    assert first == second
+    assert len(calls) == expected_calls
+
+
+@pytest.mark.asyncio
+async def test_set_settings(profiles_data: dict[str, Any]) -> None:
+    """Test set_settings() method."""
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        session_mock.patch(
+            MAP_SETTING["cache_boost"].url.format(profile_id=PROFILE_ID),
+            status=HTTPStatus.NO_CONTENT.value,
+        )
+        session_mock.patch(
+            ENDPOINTS[ATTR_BLOCK_PAGE].format(profile_id=PROFILE_ID),
+            status=HTTPStatus.NO_CONTENT.value,
+        )
+        session_mock.patch(
+            MAP_SETTING["block_tinder"].url.format(
+                profile_id=PROFILE_ID, service=MAP_SETTING["block_tinder"].name
+            ),
+            status=HTTPStatus.NO_CONTENT.value,
+        )
+
+        nextdns = await NextDns.create(session, "fakeapikey")
+
+        result = await nextdns.set_settings(
+            PROFILE_ID,
+            cache_boost=True,
+            cname_flattening=False,
+            block_page=True,
+            block_tinder=True,
+        )
+
+        performance_calls = session_mock.requests[
+            (
+                "patch",
+                URL(MAP_SETTING["cache_boost"].url.format(profile_id=PROFILE_ID)),
+            )
+        ]
+
+    await session.close()
+
+    assert result is True
+    assert len(performance_calls) == 1
+    assert orjson.loads(performance_calls[0].kwargs["data"]) == {
+        "cacheBoost": True,
+        "cnameFlattening": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_set_settings_not_supported(profiles_data: dict[str, Any]) -> None:
+    """Test set_settings() method with not supported setting."""
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+
+        nextdns = await NextDns.create(session, "fakeapikey")
+
+        with pytest.raises(SettingNotSupportedError):
+            await nextdns.set_settings(
+                PROFILE_ID, block_page=True, unsupported_setting=True
+            )
+
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_get_all_analytics_error(profiles_data: dict[str, Any]) -> None:
+    """Test that get_all_analytics() raises the original exception."""
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        session_mock.get(
+            ENDPOINTS[ATTR_ANALYTICS].format(profile_id=PROFILE_ID, type="dnssec"),
+            status=429,
+        )
+
+        nextdns = await NextDns.create(session, "fakeapikey")
+
+        with pytest.raises(ApiError, match=re.escape("Too many requests")):
+            await nextdns.get_all_analytics(PROFILE_ID)
+
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_empty_json_response(profiles_data: dict[str, Any]) -> None:
+    """Test that an empty JSON body is returned as None."""
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        session_mock.get(
+            ENDPOINTS[ATTR_GET_LOGS].format(profile_id=PROFILE_ID),
+            body=b"  ",
+            content_type="application/json",
+        )
+
+        nextdns = await NextDns.create(session, "fakeapikey")
+
+        result = await nextdns.get_logs(PROFILE_ID)
+
+    await session.close()
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_content_type_header(profiles_data: dict[str, Any]) -> None:
+    """Test that Content-Type is sent only with a request body."""
+    url = ENDPOINTS[ATTR_LOGS].format(profile_id=PROFILE_ID)
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        session_mock.patch(url, status=HTTPStatus.NO_CONTENT.value)
+
+        nextdns = await NextDns.create(session, "fakeapikey")
+        await nextdns.set_logs_location(PROFILE_ID, "us")
+
+        get_call = session_mock.requests[("get", URL(ENDPOINTS[ATTR_PROFILES]))][0]
+        patch_call = session_mock.requests[("patch", URL(url))][0]
+
+    await session.close()
+
+    assert get_call.kwargs["headers"]["X-Api-Key"] == "fakeapikey"
+    assert "Content-Type" not in get_call.kwargs["headers"]
+    assert patch_call.kwargs["headers"]["Content-Type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_get_all_analytics_error_with_coalesced_caller(
+    profiles_data: dict[str, Any],
+) -> None:
+    """Test that a failing fan-out does not cancel a coalesced caller."""
+    with Path.open("tests/fixtures/status.json", encoding="utf-8") as file:
+        status_data = json.load(file)
+
+    status_started = asyncio.Event()
+    fail_dnssec = asyncio.Event()
+    release = asyncio.Event()
+
+    async def dnssec_response(*_args: Any, **_kwargs: Any) -> CallbackResult:
+        await fail_dnssec.wait()
+        return CallbackResult(status=429)
+
+    async def status_response(*_args: Any, **_kwargs: Any) -> CallbackResult:
+        status_started.set()
+        await release.wait()
+        return CallbackResult(payload=status_data)
+
+    async def pending_response(*_args: Any, **_kwargs: Any) -> CallbackResult:
+        await release.wait()
+        return CallbackResult(payload=[])
+
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        session_mock.get(
+            ENDPOINTS[ATTR_ANALYTICS].format(profile_id=PROFILE_ID, type="dnssec"),
+            callback=dnssec_response,
+        )
+        session_mock.get(
+            ENDPOINTS[ATTR_ANALYTICS].format(profile_id=PROFILE_ID, type="status"),
+            callback=status_response,
+        )
+        for analytics_type in ("encryption", "ipVersions", "protocols"):
+            session_mock.get(
+                ENDPOINTS[ATTR_ANALYTICS].format(
+                    profile_id=PROFILE_ID, type=analytics_type
+                ),
+                callback=pending_response,
+            )
+
+        nextdns = await NextDns.create(session, "fakeapikey")
+
+        all_analytics = asyncio.create_task(nextdns.get_all_analytics(PROFILE_ID))
+        await status_started.wait()
+        status = asyncio.create_task(nextdns.get_analytics_status(PROFILE_ID))
+        await asyncio.sleep(0)
+
+        fail_dnssec.set()
+        with pytest.raises(ApiError, match=re.escape("Too many requests")):
+            await all_analytics
+
+        release.set()
+        result = await status
+
+    await session.close()
+
+    assert result.all_queries == 1380300
+
+
+@pytest.mark.asyncio
+async def test_set_settings_without_settings(profiles_data: dict[str, Any]) -> None:
+    """Test set_settings() method without any settings."""
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+
+        nextdns = await NextDns.create(session, "fakeapikey")
+
+        with pytest.raises(ValueError, match=re.escape("No settings to change")):
+            await nextdns.set_settings(PROFILE_ID)
+
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_set_settings_error(profiles_data: dict[str, Any]) -> None:
+    """Test that set_settings() raises the original exception."""
+    session = aiohttp.ClientSession()
+
+    with aioresponses() as session_mock:
+        session_mock.get(ENDPOINTS[ATTR_PROFILES], payload=profiles_data)
+        session_mock.patch(
+            MAP_SETTING["cache_boost"].url.format(profile_id=PROFILE_ID),
+            status=429,
+        )
+        session_mock.patch(
+            ENDPOINTS[ATTR_BLOCK_PAGE].format(profile_id=PROFILE_ID),
+            status=HTTPStatus.NO_CONTENT.value,
+        )
+
+        nextdns = await NextDns.create(session, "fakeapikey")
+
+        with pytest.raises(ApiError, match=re.escape("Too many requests")):
+            await nextdns.set_settings(PROFILE_ID, cache_boost=True, block_page=True)
+
+    await session.close()